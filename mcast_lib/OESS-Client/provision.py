@@ -11,6 +11,7 @@ date      Mar. 1, 2019
 brief     create circuit and add entry onto circuit
 """
 
+import os
 import sys
 import urllib2
 import urllib
@@ -51,8 +52,7 @@ if (searchResults == None):
         sys.stderr.write("provision.py: " + jsonData['error_text'] + '\n')
 else:
 	circuit_id = searchResults['circuit_id']
-	file_name = str('circuit_id.log')
-	f = open (file_name, 'w')
-	f.write(circuit_id + '\n')
-	f.close()
+	fd = os.open('circuit_id.log', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+	os.write(fd, circuit_id + '\n')
+	os.close(fd)
         sys.stdout.write(circuit_id + '\n')
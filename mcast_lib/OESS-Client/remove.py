@@ -13,11 +13,9 @@ brief     remove entry from the circuits
 import urllib2
 import urllib
 import sys
-import string
 import json
 import account
 import edit
-from subprocess import call
 global values1, values2
 node = []
 values1 = {}